@@ -18,6 +18,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import collections
 import re
 import subprocess
 import sys
@@ -26,21 +27,63 @@ from typing import Optional
 
 ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
+# invoke_command.py is stdlib-only, so run it with this interpreter
+# instead of paying for a `uv run` environment resolve on every step
+INVOKE_COMMAND = (sys.executable, str(ROOT / ".claude/PRPs/scripts/invoke_command.py"))
+
+# Sentinel line prp-core-create is asked to end with, so the path can be read
+# directly; the regexes below are the fallback when it is missing
+PRP_MARKER = "PRP_FILE:"
+PRP_MARKER_INSTRUCTION = (
+    "When the PRP file is written, end your reply with exactly one line: "
+    f"'{PRP_MARKER} <path to the PRP file relative to the project root>'"
+)
+
+# PRP path patterns, compiled once at import rather than on every lookup.
+# PRP_ANY_PATTERN matches either form so the output is scanned in a single pass.
+# Quoted paths are inline code spans, so they never cross a newline; this keeps
+# a stray backtick from pairing with one far later in the output.
+PRP_PATH_PATTERN = re.compile(r'\.claude/PRPs/features/[a-z0-9_-]+\.md')
+PRP_ANY_PATTERN = re.compile(
+    r'\.claude/PRPs/features/[a-z0-9_-]+\.md'
+    r'|`(?P<quoted>[^`\n]*\.claude/PRPs/features/[^`\n]+\.md)`'
+)
+
+# Lines of captured output kept for parsing; the PRP path is reported at the end
+CAPTURE_TAIL_LINES = 4096
+CAPTURE_BUFSIZE = 1024 * 1024
+
+# Characters at the end of the output searched before falling back to all of it
+PRP_SEARCH_TAIL = 64 * 1024
+
+BOX_WIDTH = 80
+BOX_TOP = "╭" + "─" * (BOX_WIDTH - 2) + "╮"
+BOX_BOTTOM = "╰" + "─" * (BOX_WIDTH - 2) + "╯"
+
 
 def print_box(title: str, content: str = "", icon: str = "🚀") -> None:
-    """Print a nice box for workflow steps."""
-    width = 80
+    """Print a nice box for workflow steps.
+
+    Falls back to plain lines when stdout is not a terminal (CI, log files).
+    """
+    if not sys.stdout.isatty():
+        print(f"\n== {icon} {title}")
+        if content:
+            print(content)
+        print()
+        return
+
     print()
-    print("╭" + "─" * (width - 2) + "╮")
+    print(BOX_TOP)
     title_line = f"│ {icon} {title}"
-    padding = width - len(title_line) - 1
+    padding = BOX_WIDTH - len(title_line) - 1
     print(title_line + " " * padding + "│")
     if content:
         for line in content.split("\n"):
             line = f"│ {line}"
-            padding = width - len(line) - 1
+            padding = BOX_WIDTH - len(line) - 1
             print(line + " " * padding + "│")
-    print("╰" + "─" * (width - 2) + "╯")
+    print(BOX_BOTTOM)
     print()
 
 
@@ -52,12 +95,14 @@ def run_command(
 ) -> tuple[int, str]:
     """Run a slash command using invoke_command.py.
 
+    With capture_output, output is streamed to stdout as it arrives and only
+    the last CAPTURE_TAIL_LINES lines are kept and returned.
+
     Returns:
         Tuple of (exit_code, output_text)
     """
     cmd = [
-        "uv", "run",
-        str(ROOT / ".claude/PRPs/scripts/invoke_command.py"),
+        *INVOKE_COMMAND,
         command_name,
         arguments,
         "--output-format", output_format
@@ -66,31 +111,77 @@ def run_command(
     print(f"→ Running: {command_name} {arguments}", file=sys.stderr)
 
     if capture_output:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode, result.stdout
+        tail: collections.deque[bytes] = collections.deque(maxlen=CAPTURE_TAIL_LINES)
+        out = sys.stdout.buffer
+        # Flush per line only for a live terminal; redirected output is
+        # left to the buffer so it goes out in large writes
+        live = out.isatty()
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, bufsize=CAPTURE_BUFSIZE
+        ) as proc:
+            for line in proc.stdout:
+                out.write(line)
+                if live:
+                    out.flush()
+                tail.append(line)
+        out.flush()
+        return proc.returncode, b"".join(tail).decode(errors="replace")
     else:
         result = subprocess.run(cmd)
         return result.returncode, ""
 
 
+def scan_prp_path(text: str) -> Optional[str]:
+    """Scan text for a PRP path in a single pass."""
+    # Plain paths win over quoted ones, so remember the first quoted path
+    # and keep scanning. A plain path may also sit inside a quoted span.
+    quoted = None
+    for match in PRP_ANY_PATTERN.finditer(text):
+        if match.group("quoted") is None:
+            return match.group(0)
+        inner = PRP_PATH_PATTERN.search(match.group("quoted"))
+        if inner:
+            return inner.group(0)
+        if quoted is None:
+            quoted = match.group("quoted")
+
+    return quoted
+
+
 def extract_prp_path(output: str) -> Optional[str]:
     """Extract PRP file path from prp-core-create output.
 
     Looks for patterns like:
     - `.claude/PRPs/features/xxx.md`
     - Full path to PRP file
+
+    A path on the PRP_MARKER line is used when present, whatever markdown
+    surrounds it. Otherwise the path is reported near the end, so the last
+    PRP_SEARCH_TAIL characters are searched first and the full output only
+    on a miss.
+
+    >>> extract_prp_path("**PRP_FILE:** .claude/PRPs/features/x.md")
+    '.claude/PRPs/features/x.md'
+    >>> extract_prp_path("PRP_FILE: **.claude/PRPs/features/x.md**")
+    '.claude/PRPs/features/x.md'
+    >>> extract_prp_path("PRP_FILE: `.claude/PRPs/features/x.md`.")
+    '.claude/PRPs/features/x.md'
+    >>> extract_prp_path("Wrote .claude/PRPs/features/x.md\\nPRP_FILE: <path>")
+    '.claude/PRPs/features/x.md'
     """
-    # Try to find .claude/PRPs/features/*.md pattern
-    match = re.search(r'\.claude/PRPs/features/[a-z0-9_-]+\.md', output)
-    if match:
-        return match.group(0)
+    idx = output.rfind(PRP_MARKER)
+    if idx != -1:
+        line = output[idx + len(PRP_MARKER):].split("\n", 1)[0]
+        prp_path = scan_prp_path(line)
+        if prp_path:
+            return prp_path
 
-    # Try to find quoted path
-    match = re.search(r'`([^`]*\.claude/PRPs/features/[^`]+\.md)`', output)
-    if match:
-        return match.group(1)
+    if len(output) > PRP_SEARCH_TAIL:
+        prp_path = scan_prp_path(output[-PRP_SEARCH_TAIL:])
+        if prp_path:
+            return prp_path
 
-    return None
+    return scan_prp_path(output)
 
 
 def workflow_create(feature_description: str) -> Optional[str]:
@@ -103,14 +194,11 @@ def workflow_create(feature_description: str) -> Optional[str]:
 
     exit_code, output = run_command(
         "prp-core-create",
-        feature_description,
+        f"{feature_description}\n\n{PRP_MARKER_INSTRUCTION}",
         output_format="text",
         capture_output=True
     )
 
-    # Print output
-    print(output)
-
     if exit_code != 0:
         print("❌ PRP creation failed", file=sys.stderr)
         return None
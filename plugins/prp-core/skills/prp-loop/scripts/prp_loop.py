@@ -33,6 +33,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import shutil
 import subprocess
 import sys
 import time
@@ -61,6 +62,7 @@ REVIEW_DIR = ROOT / ".claude" / "PRPs" / "reviews"
 GREEN = "VALIDATION: GREEN"
 PROTECTED_BRANCHES = {"main", "master", "development", "develop"}
 STAGE_TIMEOUT = 3600  # seconds per claude stage
+CLAUDE_BIN = shutil.which("claude") or "claude"  # resolved once; every stage spawns it
 LOOP_ARTIFACTS = (".claude/prp-loop.state.json", ".claude/prp-loop.run.log")  # never commit these
 
 
@@ -110,7 +112,7 @@ def git(*args: str) -> str:
 def run_claude(prompt: str) -> str:
     """Run one headless Claude stage; return its final result text. Raises on error."""
     cmd = [
-        "claude", "-p", prompt,
+        CLAUDE_BIN, "-p", prompt,
         "--dangerously-skip-permissions",
         "--output-format", "json",
     ]
@@ -171,8 +173,10 @@ def check_green(state: dict, result: str) -> tuple[bool, str]:
     """Decide whether validations pass. --validate is authoritative if provided."""
     cmd = state.get("validate_cmd")
     if cmd:
-        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, shell=True)
-        return proc.returncode == 0, (proc.stdout + proc.stderr)[-2000:]
+        proc = subprocess.run(
+            cmd, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, shell=True
+        )
+        return proc.returncode == 0, proc.stdout[-2000:]
     if GREEN in result:
         return True, ""
     if "VALIDATION: FAILED" in result: